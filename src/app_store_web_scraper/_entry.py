@@ -1,15 +1,31 @@
 from __future__ import annotations
-from collections.abc import Iterator
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+import sys
 import warnings
 
 from app_store_web_scraper._errors import AppNotFound
 from app_store_web_scraper._session import AppStoreSession
 from app_store_web_scraper._utils import fromisoformat_utc
 
+try:
+    import ijson
+except ImportError:
+    ijson = None  # type: ignore[assignment]
 
-@dataclass(frozen=True)
+
+# Slotted dataclasses need Python >= 3.10; on older versions, reviews fall
+# back to regular __dict__-backed instances.
+_dataclass_options: dict[str, bool]
+if sys.version_info >= (3, 10):
+    _dataclass_options = {"slots": True}
+else:
+    _dataclass_options = {}
+
+
+@dataclass(frozen=True, **_dataclass_options)
 class AppReview:
     """
     A user review fetched from the App Store.
@@ -36,6 +52,31 @@ class AppReview:
         return self.content
 
 
+def _parse_app_review(item: dict) -> AppReview:
+    attributes = item["attributes"]
+    return AppReview(
+        id=item["id"],
+        date=fromisoformat_utc(attributes["date"]),
+        user_name=attributes["userName"],
+        title=attributes["title"],
+        content=attributes["review"],
+        rating=attributes["rating"],
+        app_version="",
+    )
+
+
+def _parse_review_entry(entry: dict) -> AppReview:
+    return AppReview(
+        id=int(entry["id"]["label"]),
+        date=fromisoformat_utc(entry["updated"]["label"]),
+        user_name=entry["author"]["name"]["label"],
+        title=entry["title"]["label"],
+        content=entry["content"]["label"],
+        rating=int(entry["im:rating"]["label"]),
+        app_version=entry["im:version"]["label"],
+    )
+
+
 class AppStoreEntry:
     """
     Represents an app in the app store.
@@ -73,6 +114,13 @@ class AppStoreEntry:
     The maximum amount of pages that an iTunes Store RSS reviews feed returns.
     """
 
+    _REVIEWS_FEED_PAGE_SIZE = 50
+    """
+    The number of reviews on a full page of an iTunes Store RSS reviews feed.
+    A page with fewer entries is the last one with any reviews, so pagination
+    can stop there without fetching the next (empty) page.
+    """
+
     def __init__(
         self,
         app_id: str | int,
@@ -83,6 +131,10 @@ class AppStoreEntry:
         self.app_id = int(app_id)
         self.country = country.lower()
         self._session = session or AppStoreSession()
+        self._rss_path_template = (
+            f"/{self.country}/rss/customerreviews/page={{}}"
+            f"/id={self.app_id}/sortby=mostrecent/json"
+        )
 
     def reviews(self, limit: int = MAX_REVIEWS_LIMIT) -> Iterator[AppReview]:
         """
@@ -110,21 +162,105 @@ class AppStoreEntry:
 
         limit = min(limit, self.MAX_REVIEWS_LIMIT)
         count = 0
+        parse_review_entry = _parse_review_entry
+        page_limit = self._REVIEWS_FEED_PAGE_LIMIT
+        page_size = self._REVIEWS_FEED_PAGE_SIZE
 
-        for page in range(1, self._REVIEWS_FEED_PAGE_LIMIT + 1):
-            path = f"/{self.country}/rss/customerreviews/page={page}/id={self.app_id}/sortby=mostrecent/json"
-            data = self._session._get(path)
-            feed = data["feed"]
+        # Later pages are fetched one page ahead in a background thread,
+        # so that the network wait for page N+1 overlaps with parsing and
+        # consuming page N. The first page is streamed on the calling
+        # thread instead, which keeps the incremental parsing benefit of
+        # _fetch_feed_entries: the first review is yielded before the
+        # rest of the page has arrived.
+        executor: ThreadPoolExecutor | None = None
+        future: Future[list[dict]] | None = None
+        try:
+            page_entries = 0
+            for entry in self._fetch_feed_entries(self._rss_path_template.format(1)):
+                page_entries += 1
+                if (
+                    page_entries == page_size
+                    and page_limit > 1
+                    and page_entries < limit
+                ):
+                    # The page is full, so a follow-up page exists; start
+                    # fetching it while the tail of this one is consumed.
+                    executor = ThreadPoolExecutor(max_workers=1)
+                    future = executor.submit(self._fetch_feed_page, 2)
+                yield parse_review_entry(entry)
+                count += 1
+                if count == limit:
+                    return
 
-            # Requesting reviews for an unknown app ID does not result in
-            # a 404 response. However, the returned feed's "link" array
-            # will not contain a link of type "self" in this case.
-            app_exists = False
-            for link in feed["link"]:
-                if link["attributes"]["rel"] == "self":
-                    app_exists = True
+            if executor is None or future is None:
+                # A short first page is the only page with reviews.
+                return
+
+            for page in range(2, page_limit + 1):
+                entries = future.result()
+
+                # A short page is the last one with reviews, so there is
+                # nothing to prefetch after it; likewise if the remaining
+                # limit is already covered by the current page.
+                more_pages = len(entries) >= page_size and page < page_limit
+                if more_pages and count + len(entries) < limit:
+                    future = executor.submit(self._fetch_feed_page, page + 1)
+
+                for entry in entries:
+                    yield parse_review_entry(entry)
+                    count += 1
+                    if count == limit:
+                        return
+
+                if not more_pages:
+                    return
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
 
-            if not app_exists:
+    async def areviews(
+        self, limit: int = MAX_REVIEWS_LIMIT
+    ) -> AsyncIterator[AppReview]:
+        """
+        Asynchronous variant of :meth:`reviews` that fetches all pages of
+        the reviews feed concurrently instead of one by one, which reduces
+        the total fetch time to roughly that of the slowest page.
+
+        Requires the optional ``aiohttp`` dependency, which can be
+        installed via the ``app-store-web-scraper[async]`` extra.
+
+        Note that because the pages are requested concurrently, the
+        session's ``delay`` and ``delay_jitter`` settings are not
+        applied here; callers who rely on a delay between requests to
+        avoid rate limits should use :meth:`reviews` instead.
+
+        :param limit:
+            The maximum number of reviews to return.
+
+        :return:
+            An asynchronous iterator over the app's reviews.
+        """
+        if limit <= 0:
+            raise ValueError("Limit must be positive")
+
+        limit = min(limit, self.MAX_REVIEWS_LIMIT)
+        count = 0
+        parse_review_entry = _parse_review_entry
+
+        paths = [
+            self._rss_path_template.format(page)
+            for page in range(1, self._REVIEWS_FEED_PAGE_LIMIT + 1)
+        ]
+        pages = await self._session._aget_many(paths)
+
+        for page_index, data in enumerate(pages):
+            feed = data["feed"]
+
+            # The feed repeats the app-existence information on every
+            # page, so checking the first page is enough.
+            if page_index == 0 and not any(
+                link["attributes"]["rel"] == "self" for link in feed["link"]
+            ):
                 raise AppNotFound(self.app_id, self.country)
 
             if "entry" not in feed:
@@ -132,30 +268,79 @@ class AppStoreEntry:
                 return
 
             for entry in feed["entry"]:
-                yield self._parse_review_entry(entry)
+                yield parse_review_entry(entry)
                 count += 1
                 if count == limit:
                     return
 
-    def _parse_app_review(self, item: dict) -> AppReview:
-        attributes = item["attributes"]
-        return AppReview(
-            id=item["id"],
-            date=fromisoformat_utc(attributes["date"]),
-            user_name=attributes["userName"],
-            title=attributes["title"],
-            content=attributes["review"],
-            rating=attributes["rating"],
-            app_version="",
-        )
+            if len(feed["entry"]) < self._REVIEWS_FEED_PAGE_SIZE:
+                # A short page is the last one with reviews; skip parsing
+                # the remaining (empty) pages.
+                return
 
-    def _parse_review_entry(self, entry: dict) -> AppReview:
-        return AppReview(
-            id=int(entry["id"]["label"]),
-            date=fromisoformat_utc(entry["updated"]["label"]),
-            user_name=entry["author"]["name"]["label"],
-            title=entry["title"]["label"],
-            content=entry["content"]["label"],
-            rating=int(entry["im:rating"]["label"]),
-            app_version=entry["im:version"]["label"],
-        )
+    def _fetch_feed_page(self, page: int) -> list[dict]:
+        """
+        Fetch one page of the RSS reviews feed and return its review
+        entries as a list, so that the page can be prefetched from a
+        background thread.
+        """
+        path = self._rss_path_template.format(page)
+        return list(self._fetch_feed_entries(path, check_app_exists=page == 1))
+
+    def _fetch_feed_entries(
+        self,
+        path: str,
+        *,
+        check_app_exists: bool = True,
+    ) -> Iterator[dict]:
+        """
+        Fetch one page of the RSS reviews feed and yield its review
+        entries.
+
+        If the optional ``ijson`` dependency is installed, the entries
+        are parsed incrementally from the response stream, so the first
+        review is available before the rest of the page has been
+        downloaded and only one entry is held in memory at a time.
+        Otherwise, the whole page is downloaded and decoded up front.
+
+        :param check_app_exists:
+            Whether to verify that the feed belongs to an existing app
+            and raise :class:`AppNotFound` otherwise. The feed repeats
+            this information on every page, so only the first page of an
+            iteration needs the check.
+        """
+        # A caching session keeps whole decoded pages, so stream parsing
+        # buys nothing there; go through _get so cache hits are served.
+        if ijson is None or self._session._cache_ttl > 0:
+            feed = self._session._get(path)["feed"]
+
+            # Requesting reviews for an unknown app ID does not result in
+            # a 404 response. However, the returned feed's "link" array
+            # will not contain a link of type "self" in this case.
+            if check_app_exists and not any(
+                link["attributes"]["rel"] == "self" for link in feed["link"]
+            ):
+                raise AppNotFound(self.app_id, self.country)
+
+            yield from feed.get("entry", ())
+            return
+
+        response = self._session._get_stream(path)
+        app_exists = not check_app_exists
+        builder = ijson.ObjectBuilder()
+
+        try:
+            for prefix, event, value in ijson.parse(response):
+                if prefix == "feed.link.item.attributes.rel" and value == "self":
+                    app_exists = True
+                elif prefix.startswith("feed.entry.item"):
+                    builder.event(event, value)
+                    if prefix == "feed.entry.item" and event == "end_map":
+                        yield builder.value
+                        builder = ijson.ObjectBuilder()
+        finally:
+            response.drain_conn()
+            response.release_conn()
+
+        if not app_exists:
+            raise AppNotFound(self.app_id, self.country)
@@ -1,14 +1,41 @@
 from __future__ import annotations
 
+import asyncio
+import json
 import random
 import time
-from urllib.parse import urljoin
+from typing import TYPE_CHECKING
 
 import urllib3
 
 from .__about__ import __version__
 from ._errors import AppStoreError
 
+if TYPE_CHECKING:
+    import aiohttp
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+_ASYNC_CONNECTION_LIMIT = 10
+"""
+The maximum number of concurrent connections opened per host when
+fetching pages asynchronously.
+"""
+
+
+def _import_aiohttp():
+    try:
+        import aiohttp
+    except ImportError as error:
+        raise ImportError(
+            "aiohttp is required for asynchronous scraping; install the "
+            "'app-store-web-scraper[async]' extra to use it"
+        ) from error
+    return aiohttp
+
 
 class AppStoreSession:
     """
@@ -47,6 +74,12 @@ class AppStoreSession:
     :param retries_backoff_jitter:
         If > 0, randomly add or subtract up to this amount of seconds to each
         retry backoff time.
+
+    :param cache_ttl:
+        If > 0, responses from the App Store are cached in memory for this
+        many seconds. Iterating the reviews of the same app again within
+        that time is then served from the cache instead of re-downloading
+        identical feed pages.
     """
 
     _base_url = "https://itunes.apple.com"
@@ -59,12 +92,32 @@ class AppStoreSession:
         retries_backoff_factor: float = 5,
         retries_backoff_jitter: float = 0,
         retries_backoff_max: float = 60,
+        cache_ttl: float = 0,
     ):
         self._delay = delay
         self._delay_jitter = delay_jitter
-        self._made_first_request = False
+        self._retries = retries
+        self._retries_backoff_factor = retries_backoff_factor
+        self._retries_backoff_jitter = retries_backoff_jitter
+        self._retries_backoff_max = retries_backoff_max
+        self._last_request_at: float | None = None
+        self._cache_ttl = cache_ttl
+        self._cache: dict[str, tuple[float, dict]] = {}
+        self._pool: urllib3.HTTPConnectionPool | None = None
+        # One shared headers dict for all requests; both request paths
+        # reference it instead of rebuilding it per call.
+        self._headers = {
+            "User-Agent": f"app-store-web-scraper/{__version__}",
+            # Ask for compressed responses (urllib3 decompresses them
+            # transparently); feed pages shrink severalfold over the wire.
+            "Accept-Encoding": "gzip, deflate",
+        }
         self._http = urllib3.PoolManager(
-            headers={"User-Agent": f"app-store-web-scraper/{__version__}"},
+            num_pools=4,
+            maxsize=32,
+            block=False,
+            timeout=urllib3.Timeout(connect=5, read=30),
+            headers=self._headers,
             retries=urllib3.Retry(
                 total=retries,
                 backoff_factor=retries_backoff_factor,
@@ -75,19 +128,107 @@ class AppStoreSession:
         )
 
     def _get(self, path: str) -> dict:
+        if self._cache_ttl > 0:
+            cached = self._cache.get(path)
+            if cached is not None and time.monotonic() - cached[0] < self._cache_ttl:
+                return cached[1]
+
+        response = self._request(path)
+
+        # orjson parses the multi-hundred-KB feed payloads considerably
+        # faster than the stdlib decoder, so use it when it is installed.
+        if orjson is not None:
+            data = orjson.loads(response.data)
+        else:
+            data = response.json()
+
+        if self._cache_ttl > 0:
+            self._cache[path] = (time.monotonic(), data)
+        return data
+
+    def _get_stream(self, path: str) -> urllib3.response.BaseHTTPResponse:
+        """
+        Like :meth:`_get`, but returns the raw response with an unread
+        body so that the caller can parse it incrementally. The caller is
+        responsible for draining the response and releasing its
+        connection back to the pool.
+        """
+        return self._request(path, preload_content=False)
+
+    def _request(
+        self,
+        path: str,
+        *,
+        preload_content: bool = True,
+    ) -> urllib3.response.BaseHTTPResponse:
         if not path.startswith("/"):
             raise ValueError("Path must not be relative or a full URL")
 
-        if self._delay > 0 and self._made_first_request:
+        if self._delay > 0 and self._last_request_at is not None:
+            # Time spent parsing and consuming responses between requests
+            # already counts towards the delay, so only sleep for whatever
+            # part of it has not elapsed yet.
             jitter = random.uniform(0, self._delay_jitter)
-            time.sleep(self._delay + jitter)
-
-        url = urljoin(self._base_url, path)
-        response = self._http.request("GET", url)
+            remaining = (
+                self._delay + jitter - (time.monotonic() - self._last_request_at)
+            )
+            if remaining > 0:
+                time.sleep(remaining)
+
+        # All requests go to the same host, so resolve the connection pool
+        # once and skip PoolManager's per-request URL parsing and routing.
+        if self._pool is None:
+            self._pool = self._http.connection_from_url(self._base_url)
+
+        response = self._pool.request(
+            "GET",
+            path,
+            headers=self._headers,
+            preload_content=preload_content,
+        )
+        self._last_request_at = time.monotonic()
 
         if response.status >= 400:
+            if not preload_content:
+                response.drain_conn()
+                response.release_conn()
             message = f"iTunes API request failed with status {response.status}"
             raise AppStoreError(message)
 
-        self._made_first_request = True
-        return response.json()
+        return response
+
+    async def _aget_many(self, paths: list[str]) -> list[dict]:
+        """
+        Fetch multiple App Store API paths concurrently and return their
+        JSON bodies in the same order as ``paths``. Requires the optional
+        ``aiohttp`` dependency.
+        """
+        aiohttp = _import_aiohttp()
+        connector = aiohttp.TCPConnector(limit_per_host=_ASYNC_CONNECTION_LIMIT)
+        async with aiohttp.ClientSession(
+            base_url=self._base_url,
+            connector=connector,
+            headers=self._headers,
+        ) as http:
+            return await asyncio.gather(*(self._aget(http, path) for path in paths))
+
+    async def _aget(self, http: aiohttp.ClientSession, path: str) -> dict:
+        if not path.startswith("/"):
+            raise ValueError("Path must not be relative or a full URL")
+
+        for retry in range(self._retries + 1):
+            async with http.get(path) as response:
+                if response.status in (429, 503) and retry < self._retries:
+                    backoff = self._retries_backoff_factor * (2**retry)
+                    backoff += random.uniform(0, self._retries_backoff_jitter)
+                    await asyncio.sleep(min(backoff, self._retries_backoff_max))
+                    continue
+
+                if response.status >= 400:
+                    message = f"iTunes API request failed with status {response.status}"
+                    raise AppStoreError(message)
+
+                loads = orjson.loads if orjson is not None else json.loads
+                return await response.json(content_type=None, loads=loads)
+
+        raise AppStoreError("iTunes API request failed after all retries")
@@ -1,12 +1,15 @@
 import sys
 from datetime import datetime
 
+if sys.version_info >= (3, 11):
+    # datetime.fromisoformat handles the "Z" suffix natively since Python
+    # 3.11, so bind it directly and skip a wrapper call per parsed review.
+    fromisoformat_utc = datetime.fromisoformat
+else:
 
-def fromisoformat_utc(date_string: str) -> datetime:
-    """
-    Wrapper for :meth:datetime.fromisoformat: that handles timestamps
-    with the "Z" suffix on Python < 3.11.
-    """
-    if sys.version_info < (3, 11):
-        date_string = date_string.replace("Z", "+00:00")
-    return datetime.fromisoformat(date_string)
+    def fromisoformat_utc(date_string: str) -> datetime:
+        """
+        Wrapper for :meth:datetime.fromisoformat: that handles timestamps
+        with the "Z" suffix on Python < 3.11.
+        """
+        return datetime.fromisoformat(date_string.replace("Z", "+00:00"))
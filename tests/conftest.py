@@ -0,0 +1,98 @@
+"""
+Shared fixtures: the in-process App Store mock transport and a
+session-scoped Faker instance.
+"""
+
+from __future__ import annotations
+import io
+import json
+
+import pytest
+from faker import Faker
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+class MockResponse(io.BytesIO):
+    """
+    A minimal stand-in for a urllib3 response, readable both eagerly
+    (via ``data``/``json()``) and as a stream (via ``read()``).
+    """
+
+    def __init__(self, status: int, body: bytes):
+        super().__init__(body)
+        self.status = status
+        self.data = body
+
+    def json(self):
+        return json.loads(self.data)
+
+    def drain_conn(self):
+        pass
+
+    def release_conn(self):
+        pass
+
+
+class MockAppStoreTransport:
+    """
+    An in-process stand-in for the session's urllib3 connection pool that
+    serves registered JSON payloads via plain function calls, without
+    sockets or a real HTTP server.
+    """
+
+    def __init__(self):
+        self._bodies: dict[str, bytes] = {}
+        self.log: list[str] = []
+
+    def expect_json(self, path: str, payload: dict) -> None:
+        # Serialize once at registration; the same page may be requested
+        # several times during a test.
+        if orjson is not None:
+            self._bodies[path] = orjson.dumps(payload)
+        else:
+            self._bodies[path] = json.dumps(payload).encode()
+
+    def expect_body(self, path: str, body: bytes) -> None:
+        self._bodies[path] = body
+
+    def clear(self) -> None:
+        self._bodies.clear()
+        self.log.clear()
+
+    def connection_from_url(self, url: str) -> MockAppStoreTransport:
+        # AppStoreSession resolves its host connection pool through this.
+        return self
+
+    def request(self, method: str, path: str, **kwargs) -> MockResponse:
+        self.log.append(path)
+        body = self._bodies.get(path)
+        if body is None:
+            return MockResponse(404, b"")
+        return MockResponse(200, body)
+
+
+@pytest.fixture(scope="session")
+def mock_store() -> MockAppStoreTransport:
+    # One transport for the whole run; routes are cleared between tests
+    # by the autouse fixture below.
+    return MockAppStoreTransport()
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_store(mock_store: MockAppStoreTransport):
+    yield
+    mock_store.clear()
+
+
+@pytest.fixture(scope="session")
+def faker() -> Faker:
+    # Overrides the function-scoped fixture from Faker's pytest plugin:
+    # constructing and reseeding a Faker per test is expensive, and one
+    # deterministic instance is all the suite needs.
+    faker = Faker()
+    faker.seed_instance(0)
+    return faker
@@ -1,14 +1,18 @@
 """
-Tests the library as a whole against mocks of Apple's store APIs.
+Tests the library as a whole against in-process mocks of Apple's store APIs.
 """
 
 from __future__ import annotations
+import asyncio
+import itertools
+import json
 from datetime import timezone
+from operator import attrgetter
 
 import pytest
 from app_store_web_scraper import AppNotFound, AppReview, AppStoreEntry, AppStoreSession
+from conftest import MockAppStoreTransport
 from faker import Faker
-from pytest_httpserver import HTTPServer
 
 # --- Fixtures
 
@@ -17,28 +21,108 @@ APP_ID = "123456789"
 COUNTRY = "de"
 
 
-@pytest.fixture
-def session(httpserver: HTTPServer) -> AppStoreSession:
+@pytest.fixture(scope="session")
+def review_pool(faker: Faker) -> list[AppReview]:
+    """
+    A pool of fake reviews generated once per test run; tests slice the
+    reviews they need from it instead of regenerating them per test.
+    """
+    size = 100
+    # Faker amortizes its provider dispatch over bulk calls, so draw all
+    # the words and sentences for the pool in two calls and slice them
+    # out per review.
+    words = faker.words(3 * size)
+    sentences = faker.sentences(2 * size)
+    return [
+        fake_app_review(
+            faker,
+            title=" ".join(words[3 * i : 3 * i + 3]),
+            content=" ".join(sentences[2 * i : 2 * i + 2]),
+        )
+        for i in range(size)
+    ]
+
+
+@pytest.fixture(scope="class")
+def session(mock_store: MockAppStoreTransport):
+    async def aget_from_mock(self, http, path):
+        return mock_store.request("GET", path).json()
+
+    # Route the aiohttp-based path through the mock transport as well.
+    # The monkeypatch fixture is function-scoped, so patch manually here.
+    patcher = pytest.MonkeyPatch()
+    patcher.setattr(AppStoreSession, "_aget", aget_from_mock)
+
     session = AppStoreSession()
-    session._base_url = httpserver.url_for("")
-    return session
+    session._http = mock_store  # type: ignore[assignment]
+    yield session
+    patcher.undo()
+
+
+@pytest.fixture(scope="class")
+def app_entry(session: AppStoreSession) -> AppStoreEntry:
+    # Entries are stateless between reviews() calls, so one shared
+    # instance per test class is enough.
+    return AppStoreEntry(APP_ID, COUNTRY, session=session)
 
 
 # --- Helpers
 
 
-def fake_app_review(faker: Faker):
+# Review IDs only need to be distinct, so a plain counter beats
+# faker.unique's rejection sampling over an ever-growing seen-set.
+_review_ids = itertools.count(1)
+
+
+def fake_app_review(faker: Faker, *, title: str, content: str):
+    # Positional construction: AppReview is slotted, so skipping the
+    # keyword-argument handling is the cheapest way to build instances.
     return AppReview(
-        id=faker.unique.random_int(min=0, max=2**32),
-        date=faker.past_datetime(tzinfo=timezone.utc),
-        user_name=faker.user_name(),
-        title=" ".join(faker.words(3)),
-        content=" ".join(faker.sentences(2)),
-        rating=faker.random_int(min=1, max=5),
-        app_version="1.0.0",
+        next(_review_ids),
+        faker.past_datetime(tzinfo=timezone.utc),
+        faker.user_name(),
+        title,
+        content,
+        faker.random_int(min=1, max=5),
+        "1.0.0",
     )
 
 
+# Pulling all fields out of a review in one attrgetter call is faster than
+# seven attribute lookups per review inside the entry comprehension.
+_review_fields = attrgetter(
+    "id", "user_name", "title", "content", "rating", "app_version", "date"
+)
+
+
+def _feed_entry(id, user_name, title, content, rating, app_version, date):
+    return {
+        "id": {
+            "label": str(id),
+        },
+        "author": {
+            "name": {
+                "label": user_name,
+            },
+        },
+        "title": {
+            "label": title,
+        },
+        "content": {
+            "label": content,
+        },
+        "im:rating": {
+            "label": str(rating),
+        },
+        "im:version": {
+            "label": str(app_version),
+        },
+        "updated": {
+            "label": date.isoformat().replace("+00:00", "Z"),
+        },
+    }
+
+
 def rss_reviews_feed(reviews: list[AppReview]):
     return {
         "feed": {
@@ -50,34 +134,7 @@ def rss_reviews_feed(reviews: list[AppReview]):
                     }
                 }
             ],
-            "entry": [
-                {
-                    "id": {
-                        "label": str(review.id),
-                    },
-                    "author": {
-                        "name": {
-                            "label": review.user_name,
-                        },
-                    },
-                    "title": {
-                        "label": review.title,
-                    },
-                    "content": {
-                        "label": review.content,
-                    },
-                    "im:rating": {
-                        "label": str(review.rating),
-                    },
-                    "im:version": {
-                        "label": str(review.app_version),
-                    },
-                    "updated": {
-                        "label": review.date.isoformat().replace("+00:00", "Z"),
-                    },
-                }
-                for review in reviews
-            ],
+            "entry": [_feed_entry(*_review_fields(review)) for review in reviews],
         }
     }
 
@@ -98,6 +155,11 @@ def empty_rss_reviews_feed():
     }
 
 
+# The terminating empty page is identical in every test, so serialize it
+# once instead of rebuilding and re-encoding it per registration.
+EMPTY_FEED_BODY = json.dumps(empty_rss_reviews_feed()).encode()
+
+
 def app_not_found_rss_reviews_feed():
     return {
         "feed": {
@@ -109,10 +171,21 @@ def app_not_found_rss_reviews_feed():
     }
 
 
-def mock_rss_reviews_feed(httpserver: HTTPServer, *, page: int, feed: dict):
-    httpserver.expect_request(
-        f"/{COUNTRY}/rss/customerreviews/page={page}/id={APP_ID}/sortby=mostrecent/json"
-    ).respond_with_json(feed)
+def mock_rss_reviews_feed(
+    mock_store: MockAppStoreTransport,
+    pages: dict[int, dict | bytes],
+):
+    # One call registers the whole paging scenario; lookup on request is
+    # a single dict access keyed on the path, independent of page count.
+    for page, feed in pages.items():
+        path = (
+            f"/{COUNTRY}/rss/customerreviews/page={page}"
+            f"/id={APP_ID}/sortby=mostrecent/json"
+        )
+        if isinstance(feed, bytes):
+            mock_store.expect_body(path, feed)
+        else:
+            mock_store.expect_json(path, feed)
 
 
 # --- Tests
@@ -123,67 +196,103 @@ class TestAppReviews:
     Tests for ``AppStoreEntry.reviews``.
     """
 
+    @pytest.mark.parametrize("count", [1, 10, 49])
     def test_single_page_feed(
         self,
-        httpserver: HTTPServer,
-        faker: Faker,
-        session: AppStoreSession,
+        mock_store: MockAppStoreTransport,
+        review_pool: list[AppReview],
+        app_entry: AppStoreEntry,
+        count: int,
     ):
-        reviews = [fake_app_review(faker) for _ in range(10)]
-        mock_rss_reviews_feed(httpserver, page=1, feed=rss_reviews_feed(reviews))
-        mock_rss_reviews_feed(httpserver, page=2, feed=empty_rss_reviews_feed())
+        # A page with fewer than 50 reviews is the last one, so no
+        # follow-up page needs to be mocked.
+        reviews = review_pool[:count]
+        mock_rss_reviews_feed(mock_store, {1: rss_reviews_feed(reviews)})
 
-        app = AppStoreEntry(APP_ID, COUNTRY, session=session)
-        retrieved_reviews = list(app.reviews())
+        retrieved_reviews = list(app_entry.reviews())
 
         assert retrieved_reviews == reviews
 
     def test_multi_page_feed(
         self,
-        httpserver: HTTPServer,
-        faker: Faker,
-        session: AppStoreSession,
+        mock_store: MockAppStoreTransport,
+        review_pool: list[AppReview],
+        app_entry: AppStoreEntry,
     ):
-        reviews1 = [fake_app_review(faker) for _ in range(50)]
-        reviews2 = [fake_app_review(faker) for _ in range(10)]
-        mock_rss_reviews_feed(httpserver, page=1, feed=rss_reviews_feed(reviews1))
-        mock_rss_reviews_feed(httpserver, page=2, feed=rss_reviews_feed(reviews2))
-        mock_rss_reviews_feed(httpserver, page=3, feed=empty_rss_reviews_feed())
+        reviews1 = review_pool[:50]
+        reviews2 = review_pool[50:60]
+        mock_rss_reviews_feed(
+            mock_store,
+            {
+                1: rss_reviews_feed(reviews1),
+                2: rss_reviews_feed(reviews2),
+                3: EMPTY_FEED_BODY,
+            },
+        )
 
-        app = AppStoreEntry(APP_ID, COUNTRY, session=session)
-        retrieved_reviews = list(app.reviews())
+        retrieved_reviews = list(app_entry.reviews())
 
         assert retrieved_reviews == reviews1 + reviews2
 
-    def test_empty_feed(
+    def test_async_reviews(
         self,
-        httpserver: HTTPServer,
-        faker: Faker,
-        session: AppStoreSession,
+        mock_store: MockAppStoreTransport,
+        review_pool: list[AppReview],
+        app_entry: AppStoreEntry,
     ):
+        pytest.importorskip("aiohttp")
+        reviews = review_pool[:10]
         mock_rss_reviews_feed(
-            httpserver,
-            page=1,
-            feed=empty_rss_reviews_feed(),
+            mock_store,
+            {
+                1: rss_reviews_feed(reviews),
+                **{page: EMPTY_FEED_BODY for page in range(2, 11)},
+            },
         )
 
-        app = AppStoreEntry(APP_ID, COUNTRY, session=session)
-        retrieved_reviews = list(app.reviews())
+        async def retrieve_reviews():
+            return [review async for review in app_entry.areviews()]
+
+        assert asyncio.run(retrieve_reviews()) == reviews
+
+    def test_empty_feed(
+        self,
+        mock_store: MockAppStoreTransport,
+        review_pool: list[AppReview],
+        app_entry: AppStoreEntry,
+    ):
+        mock_rss_reviews_feed(mock_store, {1: EMPTY_FEED_BODY})
+
+        retrieved_reviews = list(app_entry.reviews())
 
         assert retrieved_reviews == []
 
-    def test_app_not_found(
+    def test_cached_session_reuses_responses(
         self,
-        httpserver: HTTPServer,
-        session: AppStoreSession,
+        mock_store: MockAppStoreTransport,
+        review_pool: list[AppReview],
     ):
+        session = AppStoreSession(cache_ttl=300)
+        session._http = mock_store  # type: ignore[assignment]
+        reviews = review_pool[:10]
         mock_rss_reviews_feed(
-            httpserver,
-            page=1,
-            feed=app_not_found_rss_reviews_feed(),
+            mock_store,
+            {1: rss_reviews_feed(reviews), 2: EMPTY_FEED_BODY},
         )
 
         app = AppStoreEntry(APP_ID, COUNTRY, session=session)
+        assert list(app.reviews()) == reviews
+        requests_after_first_run = len(mock_store.log)
+
+        assert list(app.reviews()) == reviews
+        assert len(mock_store.log) == requests_after_first_run
+
+    def test_app_not_found(
+        self,
+        mock_store: MockAppStoreTransport,
+        app_entry: AppStoreEntry,
+    ):
+        mock_rss_reviews_feed(mock_store, {1: app_not_found_rss_reviews_feed()})
 
         with pytest.raises(AppNotFound):
-            list(app.reviews())
+            list(app_entry.reviews())